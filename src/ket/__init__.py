@@ -99,13 +99,9 @@ def ket_version() -> list[str]:
     """Return the version of the Ket platform components."""
     from .clib.libket import API as libket  # pylint: disable=import-outside-toplevel
     from .clib.kbw import API as kbw  # pylint: disable=import-outside-toplevel
+    from .clib.wrapper import from_u8_to_str  # pylint: disable=import-outside-toplevel
 
-    libket_v, size = libket["ket_build_info"]()
-    libket_v = bytearray(libket_v[: size.value])
-    libket_v = libket_v.decode("utf-8")
-
-    kbw_v, size = kbw["kbw_build_info"]()
-    kbw_v = bytearray(kbw_v[: size.value])
-    kbw_v = kbw_v.decode("utf-8")
+    libket_v = from_u8_to_str(*libket["ket_build_info"]())
+    kbw_v = from_u8_to_str(*kbw["kbw_build_info"]())
 
     return [f"Ket v{__version__}", libket_v, kbw_v]
@@ -12,20 +12,15 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 
 
-from ctypes import c_size_t, c_uint8
+from ctypes import c_size_t, c_uint8, string_at
 from json import loads
-from typing import Literal, Optional, Any
+from typing import TYPE_CHECKING, Literal, Optional, Any
 
 from .clib.libket import Process as LibketProcess
 from .clib.kbw import get_simulator
 
-try:
+if TYPE_CHECKING:
     import plotly.graph_objs as go
-    import plotly.express as px
-
-    VISUALIZE = True
-except ImportError:
-    VISUALIZE = False
 
 __all__ = [
     "Process",
@@ -176,7 +171,7 @@ class Process(LibketProcess):
         coupling_graph: Optional[list[tuple[int, int]]] = None,
     ):
         if DEFAULT_PROCESS_CONFIGURATION["force"] or all(
-            map(lambda a: a is None, [configuration, num_qubits, simulator, execution])
+            arg is None for arg in (configuration, num_qubits, simulator, execution)
         ):
             configuration = (
                 DEFAULT_PROCESS_CONFIGURATION["configuration"]
@@ -205,7 +200,7 @@ class Process(LibketProcess):
             )
 
         if configuration is not None and any(
-            map(lambda a: a is not None, [num_qubits, simulator, execution])
+            arg is not None for arg in (num_qubits, simulator, execution)
         ):
             raise ValueError("Cannot specify arguments if configuration is provided")
 
@@ -227,10 +222,8 @@ class Process(LibketProcess):
                 )
             )
 
-        self._metadata_buffer_size = 512
-        self._metadata_buffer = (c_uint8 * self._metadata_buffer_size)()
-        self._instructions_buffer_size = 2048
-        self._instructions_buffer = (c_uint8 * self._instructions_buffer_size)()
+        self._metadata_buffer = (c_uint8 * 512)()
+        self._instructions_buffer = (c_uint8 * 2048)()
 
     def alloc(self, num_qubits: int = 1) -> Quant:
         """Allocate a specified number of qubits and return a :class:`~ket.base.Quant` object.
@@ -264,6 +257,20 @@ class Process(LibketProcess):
     def _get_ket_process(self):
         return self
 
+    @staticmethod
+    def _read_json(write_json, buffer) -> tuple[Any, Any]:
+        """Read a JSON document from Libket, growing the buffer if it is too small.
+
+        Returns the parsed document and the buffer to keep for the next read.
+        """
+
+        write_size = write_json(buffer, len(buffer))
+        if write_size.value > len(buffer):
+            buffer = (c_uint8 * (write_size.value + 1))()
+            write_size = write_json(buffer, len(buffer))
+
+        return loads(string_at(buffer, write_size.value)), buffer
+
     def get_instructions(self) -> list[dict[str, Any]]:
         """Retrieve quantum instructions from the quantum process.
 
@@ -295,15 +302,10 @@ class Process(LibketProcess):
              {'Gate': {'control': [], 'gate': 'Hadamard', 'target': 0}},
              {'Gate': {'control': [0], 'gate': 'PauliX', 'target': 1}}]
         """
-        write_size = self.instructions_json(
-            self._instructions_buffer, self._instructions_buffer_size
+        instructions, self._instructions_buffer = self._read_json(
+            self.instructions_json, self._instructions_buffer
         )
-        if write_size.value > self._instructions_buffer_size:
-            self._instructions_buffer_size = write_size.value + 1
-            self._instructions_buffer = (c_uint8 * self._instructions_buffer_size)()
-            return self.get_instructions()
-
-        return loads(bytearray(self._instructions_buffer[: write_size.value]))
+        return instructions
 
     def get_isa_instructions(self) -> list[dict[str, Any]] | None:
         """Retrieve transpiled quantum instructions from the quantum process.
@@ -313,15 +315,10 @@ class Process(LibketProcess):
             if the process has been transpiled, otherwise None.
 
         """
-        write_size = self.isa_instructions_json(
-            self._instructions_buffer, self._instructions_buffer_size
+        instructions, self._instructions_buffer = self._read_json(
+            self.isa_instructions_json, self._instructions_buffer
         )
-        if write_size.value > self._instructions_buffer_size:
-            self._instructions_buffer_size = write_size.value + 1
-            self._instructions_buffer = (c_uint8 * self._instructions_buffer_size)()
-            return self.get_isa_instructions()
-
-        return loads(bytearray(self._instructions_buffer[: write_size.value]))
+        return instructions
 
     def get_metadata(self) -> dict[str, Any]:
         """Retrieve metadata from the quantum process.
@@ -357,15 +354,10 @@ class Process(LibketProcess):
              'timeout': None}
         """
 
-        write_size = self.metadata_json(
-            self._metadata_buffer, self._metadata_buffer_size
+        metadata, self._metadata_buffer = self._read_json(
+            self.metadata_json, self._metadata_buffer
         )
-        if write_size.value > self._metadata_buffer_size:
-            self._metadata_buffer_size = write_size.value + 1
-            self._metadata_buffer = (c_uint8 * self._metadata_buffer_size)()
-            return self.get_metadata()
-
-        return loads(bytearray(self._metadata_buffer[: write_size.value]))
+        return metadata
 
     def __repr__(self) -> str:
         return f"<Ket 'Process' id={hex(id(self))}>"
@@ -424,6 +416,8 @@ class Quant:
 
     """
 
+    __slots__ = ("qubits", "process")
+
     def __init__(self, *, qubits: list[int], process: Process):
         self.qubits = qubits
         self.process = process
@@ -434,7 +428,7 @@ class Quant:
     def __add__(self, other: Quant) -> Quant:
         if self.process is not other.process:
             raise ValueError("Cannot concatenate qubits from different processes")
-        if any(qubit in other.qubits for qubit in self.qubits):
+        if not set(self.qubits).isdisjoint(other.qubits):
             raise ValueError("Cannot concatenate qubits with overlapping indices")
         return Quant(qubits=self.qubits + other.qubits, process=self.process)
 
@@ -467,35 +461,25 @@ class Quant:
             A new :class:`~ket.base.Quant` object containing the selected qubits.
         """
 
-        return Quant(qubits=[self.qubits[i] for i in index], process=self.process)
+        return Quant(
+            qubits=list(map(self.qubits.__getitem__, index)), process=self.process
+        )
 
     def __reversed__(self):
-        return Quant(qubits=list(reversed(self.qubits)), process=self.process)
+        return Quant(qubits=self.qubits[::-1], process=self.process)
 
     def __getitem__(self, key):
-        qubits = self.qubits.__getitem__(key)
+        if isinstance(key, int):
+            return Quant(qubits=[self.qubits[key]], process=self.process)
+        qubits = self.qubits[key]
         return Quant(
             qubits=qubits if isinstance(qubits, list) else [qubits],
             process=self.process,
         )
 
-    class _QuantIter:
-        def __init__(self, q: Quant):
-            self.q = q
-            self.idx = -1
-            self.size = len(q.qubits)
-
-        def __next__(self):
-            self.idx += 1
-            if self.idx < self.size:
-                return self.q[self.idx]
-            raise StopIteration
-
-        def __iter__(self):
-            return self
-
     def __iter__(self):
-        return self._QuantIter(self)
+        process = self.process
+        return (Quant(qubits=[qubit], process=process) for qubit in self.qubits)
 
     def __len__(self):
         return len(self.qubits)
@@ -528,6 +512,8 @@ class Measurement:
             print(result.value)  # 0 or 3
     """
 
+    __slots__ = ("process", "qubits", "indexes", "_value")
+
     def __init__(self, qubits: Quant):
         self.process = qubits.process
         self.qubits = [qubits[i : i + 64] for i in range(0, len(qubits), 64)]
@@ -609,6 +595,8 @@ class Samples:
 
     """
 
+    __slots__ = ("qubits", "process", "index", "_value", "shots")
+
     def __init__(self, qubits: Quant, shots: int = 2048):
         self.qubits = qubits
         self.process = qubits.process
@@ -661,6 +649,8 @@ class Samples:
             Histogram of sample measurement.
         """
         _check_visualize()
+        # pylint: disable=import-outside-toplevel,import-error
+        import plotly.express as px
 
         data = {
             "State": list(self.get().keys()),
@@ -688,9 +678,36 @@ class Samples:
         return f"<Ket 'Samples' index={self.index}, pid={hex(id(self.process))}>"
 
 
+def _join_quant(quants) -> Quant:
+    """Concatenate an iterable of :class:`~ket.base.Quant` in a single pass.
+
+    Equivalent to ``reduce(add, quants)`` without building the intermediate objects.
+    """
+
+    process = None
+    qubits = []
+    for quant in quants:
+        if process is None:
+            process = quant.process
+        elif quant.process is not process:
+            raise ValueError("Cannot concatenate qubits from different processes")
+        qubits.extend(quant.qubits)
+
+    if process is None:
+        raise TypeError("Cannot concatenate an empty sequence of qubits")
+    if len(set(qubits)) != len(qubits):
+        raise ValueError("Cannot concatenate qubits with overlapping indices")
+
+    return Quant(qubits=qubits, process=process)
+
+
 def _check_visualize():
-    if not VISUALIZE:
+    # pylint: disable=import-outside-toplevel,unused-import
+    try:
+        import plotly.graph_objs
+        import plotly.express
+    except ImportError as exc:
         raise RuntimeError(
             "Visualization optional dependence are required. Install with: "
             "pip install ket-lang[visualization]"
-        )
+        ) from exc
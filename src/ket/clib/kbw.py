@@ -8,12 +8,10 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 
 from ctypes import POINTER, c_void_p, c_size_t, c_bool, c_int32, c_uint32, c_uint8
-from functools import reduce
-from operator import iconcat
 from typing import Literal
 from os import environ
 from os.path import dirname
-from .wrapper import load_lib, os_lib_name
+from .wrapper import load_lib, os_lib_name, from_coupling_graph
 
 API_argtypes = {
     "kbw_set_log_level": ([c_uint32], []),
@@ -67,10 +65,7 @@ def get_simulator(
 ):
     """Create a configuration"""
 
-    coupling_graph_size = len(coupling_graph) if coupling_graph else 0
-    if coupling_graph:
-        coupling_graph = reduce(iconcat, coupling_graph, [])
-        coupling_graph = (c_size_t * len(coupling_graph))(*coupling_graph)
+    coupling_graph, coupling_graph_size = from_coupling_graph(coupling_graph)
 
     return API["kbw_make_configuration"](
         num_qubits,
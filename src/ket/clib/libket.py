@@ -20,13 +20,11 @@ from ctypes import (
     c_uint64,
     c_double,
 )
-from functools import reduce
-from operator import iconcat
 from typing import Literal
 import weakref
 from os import environ
 from os.path import dirname
-from .wrapper import load_lib, os_lib_name
+from .wrapper import load_lib, os_lib_name, from_coupling_graph
 
 
 HADAMARD = 0
@@ -183,6 +181,10 @@ class Process:
         return "<Libket 'process'>"
 
 
+_FEATURE_STATUS = {"Disable": 0, "Allowed": 1}
+_U2_GATE_SET = {"All": 0, "ZYZ": 1, "RzSx": 2}
+
+
 def make_configuration(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     num_qubits: int,
     batch_execution,
@@ -197,30 +199,18 @@ def make_configuration(  # pylint: disable=too-many-arguments,too-many-positiona
 ) -> Process:
     """Make a Libket configuration"""
 
-    def feature_status(value):
-        if value == "Disable":
-            return 0
-        if value == "Allowed":
-            return 1
-        return 2
-
-    coupling_graph_size = len(coupling_graph) if coupling_graph else 0
-    if coupling_graph_size > 0:
-        coupling_graph = reduce(iconcat, coupling_graph, [])
-        coupling_graph = (c_size_t * len(coupling_graph))(*coupling_graph)
-    else:
-        coupling_graph = None
+    coupling_graph, coupling_graph_size = from_coupling_graph(coupling_graph)
 
     return API["ket_make_configuration"](
         num_qubits,
         batch_execution,
-        feature_status(measure),
-        feature_status(sample),
-        feature_status(exp_value),
-        feature_status(dump),
+        _FEATURE_STATUS.get(measure, 2),
+        _FEATURE_STATUS.get(sample, 2),
+        _FEATURE_STATUS.get(exp_value, 2),
+        _FEATURE_STATUS.get(dump, 2),
         define_qpu,
         coupling_graph,
         coupling_graph_size,
         1 if u4_gate_type == "CZ" else 0,
-        {"All": 0, "ZYZ": 1, "RzSx": 2}[u2_gate_set],
+        _U2_GATE_SET[u2_gate_set],
     )
@@ -5,7 +5,8 @@
 
 """Unitary for handle shared library with C API"""
 
-from ctypes import POINTER, c_uint8, c_size_t, c_int32, cdll
+from ctypes import POINTER, c_uint8, c_size_t, c_int32, cdll, string_at
+from itertools import chain
 import os
 
 
@@ -24,7 +25,16 @@ def os_lib_name(lib):
 def from_u8_to_str(data, size):
     """Convert a unsigned char vector to a Python string"""
 
-    return bytearray(data[: size.value]).decode()
+    return string_at(data, size.value).decode()
+
+
+def from_coupling_graph(coupling_graph):
+    """Flatten a coupling graph into a C array and return it with its number of edges"""
+
+    if not coupling_graph:
+        return None, 0
+    edges = list(chain.from_iterable(coupling_graph))
+    return (c_size_t * len(edges))(*edges), len(coupling_graph)
 
 
 class CLibError(Exception):
@@ -61,7 +71,7 @@ class APIWrapper:  # pylint: disable=R0903
                 error_msg_buffer_size = write_size.value
                 error_message_buffer = (c_uint8 * error_msg_buffer_size)()
 
-            error_msg = bytearray(error_message_buffer[: write_size.value]).decode()
+            error_msg = from_u8_to_str(error_message_buffer, write_size)
             raise CLibError(f"{self.lib_name}: {error_msg}", error_code)
         if len(out) == 1:
             return out[0]
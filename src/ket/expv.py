@@ -13,11 +13,9 @@ from __future__ import annotations
 # pylint: disable=duplicate-code
 
 from ctypes import c_int32, c_size_t
-from functools import reduce
-from operator import add
 from typing import Literal
 
-from .base import Process, Quant
+from .base import Process, Quant, _join_quant
 
 from .clib.libket import API
 
@@ -94,7 +92,7 @@ class Pauli:
         _coef: float | None = None,
     ):
         if not isinstance(qubits, Quant) and _qubits_list is None:
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         self.process = _process if _process is not None else qubits.process
         self.pauli_list = _pauli_list if _pauli_list is not None else [pauli]
@@ -287,6 +285,8 @@ class ExpValue:
 
     """
 
+    __slots__ = ("process", "index", "_value")
+
     pauli_map = {"X": 1, "Y": 2, "Z": 3}
 
     def __init__(self, hamiltonian: Hamiltonian | Pauli):
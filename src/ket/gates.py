@@ -44,8 +44,6 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 
 from math import pi
-from functools import reduce
-from operator import add
 from typing import Any, Callable
 
 from .clib.libket import (
@@ -59,8 +57,8 @@ from .clib.libket import (
     PHASE_SHIFT,
 )
 
-from .base import Process, Quant
-from .operations import _search_process, ctrl, cat, kron, around
+from .base import Process, Quant, _join_quant
+from .operations import _search_process, cat, kron, around, control
 
 __all__ = [
     "I",
@@ -102,7 +100,7 @@ def I(  # pylint: disable=invalid-name missing-function-docstring
     qubits: Quant,
 ) -> Quant:
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     return qubits
 
@@ -119,7 +117,7 @@ def X(  # pylint: disable=invalid-name missing-function-docstring
     qubits: Quant,
 ) -> Quant:
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     for qubit in qubits.qubits:
         qubits.process.apply_gate(PAULI_X, 0.0, qubit)
@@ -138,7 +136,7 @@ def Y(  # pylint: disable=invalid-name missing-function-docstring
     qubits: Quant,
 ) -> Quant:
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     for qubit in qubits.qubits:
         qubits.process.apply_gate(PAULI_Y, 0.0, qubit)
@@ -157,7 +155,7 @@ def Z(  # pylint: disable=invalid-name missing-function-docstring
     qubits: Quant,
 ) -> Quant:
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     for qubit in qubits.qubits:
         qubits.process.apply_gate(PAULI_Z, 0.0, qubit)
@@ -176,7 +174,7 @@ def H(  # pylint: disable=invalid-name missing-function-docstring
     qubits: Quant,
 ) -> Quant:
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     for qubit in qubits.qubits:
         qubits.process.apply_gate(HADAMARD, 0.0, qubit)
@@ -199,7 +197,7 @@ def RX(  # pylint: disable=invalid-name missing-function-docstring
 
     def inner(qubits: Quant) -> Quant:
         if not isinstance(qubits, Quant):
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         for qubit in qubits.qubits:
             qubits.process.apply_gate(ROTATION_X, theta, qubit)
@@ -228,7 +226,7 @@ def RY(  # pylint: disable=invalid-name missing-function-docstring
 
     def inner(qubits: Quant) -> Quant:
         if not isinstance(qubits, Quant):
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         for qubit in qubits.qubits:
             qubits.process.apply_gate(ROTATION_Y, theta, qubit)
@@ -257,7 +255,7 @@ def RZ(  # pylint: disable=invalid-name missing-function-docstring
 
     def inner(qubits: Quant) -> Quant:
         if not isinstance(qubits, Quant):
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         for qubit in qubits.qubits:
             qubits.process.apply_gate(ROTATION_Z, theta, qubit)
@@ -282,7 +280,7 @@ def PHASE(  # pylint: disable=invalid-name missing-function-docstring
 
     def inner(qubits: Quant) -> Quant:
         if not isinstance(qubits, Quant):
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         for qubit in qubits.qubits:
             qubits.process.apply_gate(PHASE_SHIFT, theta, qubit)
@@ -338,7 +336,8 @@ def CNOT(  # pylint: disable=invalid-name missing-function-docstring
     control_qubit: Quant, target_qubit: Quant
 ) -> tuple[Quant, Quant]:
     for c, t in zip(control_qubit, target_qubit):
-        ctrl(c, X)(t)
+        with control(c):
+            X(t)
     return control_qubit, target_qubit
 
 
@@ -15,19 +15,15 @@ from __future__ import annotations
 #
 # SPDX-License-Identifier: Apache-2.0
 
-try:
-    from qiskit import QuantumCircuit
-    from qiskit.providers import Backend
-except ImportError as exc:
-    raise ImportError(
-        "IBMDevice requires the qiskit module to be used. You can install them"
-        "alongside ket by running `pip install ket[ibm]`."
-    ) from exc
-
 import json
-from ctypes import CFUNCTYPE, POINTER, c_uint8, c_size_t
+from ctypes import CFUNCTYPE, POINTER, c_uint8, c_size_t, string_at
+from itertools import permutations
+from typing import TYPE_CHECKING
 from ..clib.libket import BatchCExecution, make_configuration
-from .ibm_client import IBMClient
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.providers import Backend
 
 __all__ = ["IBMDevice"]
 
@@ -48,21 +44,20 @@ class IBMDevice:
         *,
         use_qiskit_transpiler: bool = False,
     ) -> None:
+        # Deferred so that importing ket.ibm does not load qiskit_ibm_runtime.
+        from .ibm_client import IBMClient  # pylint: disable=import-outside-toplevel
+
         self.num_qubits = (
             num_qubits if num_qubits is not None else backend.configuration().n_qubits
         )
         self.client = IBMClient(self.num_qubits, backend)
 
         if not use_qiskit_transpiler:
+            coupling_map = backend.coupling_map
             self.coupling_graph = (
-                list(backend.coupling_map.graph.edge_list())
-                if backend.coupling_map
-                else [
-                    [i, j]
-                    for i in range(self.num_qubits)
-                    for j in range(self.num_qubits)
-                    if i != j
-                ]
+                list(coupling_map.graph.edge_list())
+                if coupling_map
+                else list(permutations(range(self.num_qubits), 2))
             )
         else:
             self.coupling_graph = None
@@ -80,10 +75,10 @@ class IBMDevice:
         ):
             """Sends the ket circuit instructions from libket to the IBM Client."""
             logical_circuit = json.loads(
-                bytearray(logical_circuit[:logical_circuit_size])
+                string_at(logical_circuit, logical_circuit_size)
             )
             physical_circuit = json.loads(
-                bytearray(physical_circuit[:physical_circuit_size])
+                string_at(physical_circuit, physical_circuit_size)
             )
             self._formatted_result = self.client.process_instructions(
                 physical_circuit if physical_circuit is not None else logical_circuit
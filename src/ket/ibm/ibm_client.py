@@ -20,6 +20,8 @@ except ImportError as exc:
         "QiskitClient requires the qiskit module to be used. You can install them"
         "alongside ket by running `pip install ket[ibm]`."
     ) from exc
+from collections import Counter
+from operator import itemgetter
 from typing import Any
 from .qiskit_builder import QiskitBuilder
 
@@ -46,6 +48,11 @@ class IBMClient:
     ) -> None:
         self.backend = backend
         self.qiskit_builder = QiskitBuilder(num_qubits)
+        self._pass_manager = generate_preset_pass_manager(
+            target=backend.target,
+            optimization_level=1,
+            initial_layout=list(range(num_qubits)) if backend.coupling_map else None,
+        )
         self.isa_circuit = None
         self.result = None
 
@@ -61,16 +68,7 @@ class IBMClient:
         builder_data = self.qiskit_builder.build(
             instructions, measurement_map, sample_map
         )
-        pm = generate_preset_pass_manager(
-            target=self.backend.target,
-            optimization_level=1,
-            initial_layout=(
-                list(range(self.qiskit_builder.num_qubits))
-                if self.backend.coupling_map
-                else None
-            ),
-        )
-        self.isa_circuit = pm.run(builder_data["circuit"])
+        self.isa_circuit = self._pass_manager.run(builder_data["circuit"])
 
         with Session(backend=self.backend) as session:
             if sample_map or measurement_map:
@@ -93,21 +91,30 @@ class IBMClient:
 
             # BUG: The following code is not working as expected. The EstimatorV2
             # class is not always returning the expected results.
-            for observable in builder_data["observables"]:
-                isa_observable = observable.apply_layout(self.isa_circuit.layout)
-                result = (
+            if builder_data["observables"]:
+                pub_results = (
                     Estimator(mode=session)
-                    .run([(self.isa_circuit, isa_observable)])
-                    .result()[0]
-                    .data.evs
-                ).tolist()
-
-                # Calling tolist() on an ndarray with a single element returns a
-                # scalar, so we need to check if the result is a list or a scalar.
-                if isinstance(result, list):
-                    raw_results["exp_values"].extend(result)
-                else:
-                    raw_results["exp_values"].append(result)
+                    .run(
+                        [
+                            (
+                                self.isa_circuit,
+                                observable.apply_layout(self.isa_circuit.layout),
+                            )
+                            for observable in builder_data["observables"]
+                        ]
+                    )
+                    .result()
+                )
+
+                for pub_result in pub_results:
+                    result = pub_result.data.evs.tolist()
+
+                    # Calling tolist() on an ndarray with a single element returns a
+                    # scalar, so we need to check if the result is a list or a scalar.
+                    if isinstance(result, list):
+                        raw_results["exp_values"].extend(result)
+                    else:
+                        raw_results["exp_values"].append(result)
 
         if "shots" in sample_map:
             del sample_map["shots"]
@@ -127,26 +134,29 @@ class IBMClient:
             "execution_time": None,
         }
 
+        # Qiskit bitstrings are little-endian, so qubit i is the character at -1 - i.
         if meas_map:
             meas_bin = max(raw_results["samples"], key=raw_results["samples"].get)
-            reversed_meas_bin = meas_bin[::-1]
 
             # meas_index is the index of the measurement in the measurement map, as
             # there can be multiple measurements in a single instruction.
             # qubits is the list of qubits that were measured.
             for meas_index, qubits in meas_map.items():
                 result_dict["measurements"][meas_index] = int(
-                    "".join([reversed_meas_bin[qubit] for qubit in qubits]), 2
+                    "".join(itemgetter(*[-1 - qubit for qubit in qubits])(meas_bin)), 2
                 )
 
         if sample_map:
+            # A sample may read only part of the measured register, so different
+            # outcomes can decode to the same state; their counts are summed.
             for sample_index, qubits in sample_map.items():
+                get_bits = itemgetter(*[-1 - qubit for qubit in qubits])
+                counts = Counter()
+                for measurement, count in raw_results["samples"].items():
+                    counts[int("".join(get_bits(measurement)), 2)] += count
                 result_dict["samples"][sample_index] = (
-                    [
-                        int("".join([measurement[::-1][i] for i in qubits]), 2)
-                        for measurement in raw_results["samples"].keys()
-                    ],
-                    list(raw_results["samples"].values()),
+                    list(counts.keys()),
+                    list(counts.values()),
                 )
 
         result_dict["exp_values"].extend(raw_results["exp_values"])
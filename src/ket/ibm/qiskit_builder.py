@@ -19,6 +19,20 @@ except ImportError as exc:
     ) from exc
 from typing import Any
 
+_GATES = {
+    "PauliX": library.XGate,
+    "PauliY": library.YGate,
+    "PauliZ": library.ZGate,
+    "Hadamard": library.HGate,
+}
+
+_PARAMETRIC_GATES = {
+    "RotationX": library.RXGate,
+    "RotationY": library.RYGate,
+    "RotationZ": library.RZGate,
+    "Phase": library.U1Gate,
+}
+
 
 class QiskitBuilder:
     """Builder for qiskit quantum circuits from ket-lang instructions."""
@@ -34,43 +48,44 @@ class QiskitBuilder:
             "circuit": self.circuit,
             "observables": [],
         }
+        circuit = data["circuit"]
+        get_qubit_index = self._get_qubit_index
 
         for inst in instructions:
             if "Identity" in inst:
                 continue
 
             if "Gate" in inst:
-                gate_type = inst["Gate"]["gate"]
-                gate: Gate = self.get_gate(gate_type)
+                gate_inst = inst["Gate"]
+                gate: Gate = self.get_gate(gate_inst["gate"])
 
-                control = inst["Gate"]["control"]
-                if len(control):
+                control = gate_inst["control"]
+                if control:
                     gate = gate.control(len(control))
-                control = [self._get_qubit_index(qubit) for qubit in control]
-                data["circuit"].append(
-                    gate, control + [self._get_qubit_index(inst["Gate"]["target"])]
+                circuit.append(
+                    gate,
+                    [get_qubit_index(qubit) for qubit in control]
+                    + [get_qubit_index(gate_inst["target"])],
                 )
 
             elif "Measure" in inst:
-                qubits = [
-                    self._get_qubit_index(qubit) for qubit in inst["Measure"]["qubits"]
-                ]
-                meas_map[inst["Measure"]["index"]] = qubits
-                data["circuit"].measure(qubits, qubits)
+                measure_inst = inst["Measure"]
+                qubits = [get_qubit_index(qubit) for qubit in measure_inst["qubits"]]
+                meas_map[measure_inst["index"]] = qubits
+                circuit.measure(qubits, qubits)
 
             elif "ExpValue" in inst:
                 hamiltonian: dict = inst["ExpValue"]["hamiltonian"]
                 data["observables"].append(self.build_observable(hamiltonian))
 
             elif "Sample" in inst:
-                qubits = [
-                    self._get_qubit_index(qubit) for qubit in inst["Sample"]["qubits"]
-                ]
-                sample_map[inst["Sample"]["index"]] = qubits
+                sample_inst = inst["Sample"]
+                qubits = [get_qubit_index(qubit) for qubit in sample_inst["qubits"]]
+                sample_map[sample_inst["index"]] = qubits
                 sample_map["shots"] = max(
-                    sample_map.get("shots", 2048), inst["Sample"]["shots"]
+                    sample_map.get("shots", 2048), sample_inst["shots"]
                 )
-                data["circuit"].measure(qubits, qubits)
+                circuit.measure(qubits, qubits)
 
             elif "Dump" in inst:
                 raise RuntimeError("Operation not supported")
@@ -90,35 +105,15 @@ class QiskitBuilder:
     def get_gate(self, gate_type) -> Gate:
         """From the type of the gate, returns the corresponding qiskit gate object."""
 
-        if "PauliX" in gate_type:
-            return library.XGate()
-        if "PauliY" in gate_type:
-            return library.YGate()
-        if "PauliZ" in gate_type:
-            return library.ZGate()
-        if "Hadamard" in gate_type:
-            return library.HGate()
-        if isinstance(gate_type, dict) and any(
-            "Rotation" in key or "Phase" in key for key in list(gate_type.keys())
-        ):
-            angle = list(gate_type.values())[0]
-            return self._get_rotation_or_phase_gate(gate_type, angle)
+        if isinstance(gate_type, str) and gate_type in _GATES:
+            return _GATES[gate_type]()
+        if isinstance(gate_type, dict) and len(gate_type) == 1:
+            ((name, angle),) = gate_type.items()
+            if name in _PARAMETRIC_GATES:
+                return _PARAMETRIC_GATES[name](angle)
 
         raise RuntimeError("Unknown gate")
 
-    def _get_rotation_or_phase_gate(self, gate_type, theta) -> Gate:
-        """From the type of the gate, returns the corresponding qiskit rotation or
-        phase gate object."""
-
-        if "RotationX" in gate_type:
-            return library.RXGate(theta)
-        if "RotationY" in gate_type:
-            return library.RYGate(theta)
-        if "RotationZ" in gate_type:
-            return library.RZGate(theta)
-
-        return library.U1Gate(theta)  # Phase gate
-
     def build_observable(self, hamiltonian: dict[str, Any]) -> SparsePauliOp:
         """Builds a Qiskit compliant observable format from the ket-lang hamiltonian
         format.
@@ -10,14 +10,12 @@ from __future__ import annotations
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import reduce
-from operator import add
 from typing import Callable, Literal
 from cmath import asin, exp, isclose, cos, sin
 from math import acos, sqrt, atan2
 from collections.abc import Sized, Iterable
 
-from ..base import Quant, Process
+from ..base import Quant, Process, _join_quant
 from ..operations import ctrl, around, dump
 from ..gates import RZ, X, Z, H, RY, CNOT, S, global_phase
 
@@ -60,7 +58,7 @@ def flip_to_control(
 
     def inner(qubits: Quant) -> Quant:
         if not isinstance(qubits, Quant):
-            qubits = reduce(add, qubits)
+            qubits = _join_quant(qubits)
 
         length = len(qubits)
         if isinstance(control_state, Sized):
@@ -169,7 +167,7 @@ def dump_matrix(
     mat = [[0.0j for _ in range(2**num_qubits)] for _ in range(2**num_qubits)]
 
     qubit_args = [process.alloc(n) for n in qubit_args]
-    row = reduce(add, qubit_args)
+    row = _join_quant(qubit_args)
     column = process.alloc(num_qubits)
 
     H(column)
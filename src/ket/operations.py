@@ -15,8 +15,6 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from ctypes import c_size_t
-from functools import reduce
-from operator import add
 from typing import Any, Callable, Sequence
 
 
@@ -25,6 +23,7 @@ from .base import (
     Quant,
     Measurement,
     Samples,
+    _join_quant,
 )
 from .quantumstate import QuantumState
 
@@ -92,7 +91,7 @@ def control(control_qubits: Quant):
         control_qubits: The qubits to control the quantum operations.
     """
     if not isinstance(control_qubits, Quant):
-        control_qubits = reduce(add, control_qubits)
+        control_qubits = _join_quant(control_qubits)
 
     process = control_qubits.process
     process.ctrl_push(
@@ -138,8 +137,14 @@ def ctrl(control_qubits: Quant, gate: Callable[[Any], Any]) -> Callable[[Any], A
         A new callable that applies the given gate with the control qubits.
     """
 
+    joined = (
+        control_qubits
+        if isinstance(control_qubits, Quant)
+        else _join_quant(control_qubits)
+    )
+
     def inner(*args, **kwargs):
-        with control(control_qubits):
+        with control(joined):
             return control_qubits, gate(*args, **kwargs)
 
     return inner
@@ -349,7 +354,8 @@ def around(
         yield
     finally:
         ket_process.ctrl_stack()
-        adj(gate)(*args, ket_process=ket_process, **kwargs)
+        with inverse(ket_process):
+            gate(*args, **kwargs)
         ket_process.ctrl_unstack()
 
 
@@ -363,7 +369,7 @@ def measure(qubits: Quant) -> Measurement:
         Object representing the measurement results.
     """
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     return Measurement(qubits)
 
@@ -378,7 +384,7 @@ def dump(qubits: Quant) -> QuantumState:
         Object representing the quantum state.
     """
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     return QuantumState(qubits)
 
@@ -394,7 +400,7 @@ def sample(qubits: Quant, shots: int = 2048) -> Samples:
         Object representing the measurement samples.
     """
     if not isinstance(qubits, Quant):
-        qubits = reduce(add, qubits)
+        qubits = _join_quant(qubits)
 
     return Samples(qubits, int(shots))
 
@@ -13,29 +13,33 @@ from __future__ import annotations
 from math import pi
 from random import Random
 from cmath import sqrt, phase
-from collections import defaultdict
-from typing import Literal
+from collections import Counter, defaultdict
+from functools import reduce
+from itertools import accumulate
+from typing import TYPE_CHECKING, Literal
 from ctypes import c_size_t
+from sys import modules
 
 from .base import Quant, _check_visualize
 
-try:
-    import numpy as np
+if TYPE_CHECKING:
     import plotly.graph_objs as go
-    import plotly.express as px
-except ImportError:
-    pass
-
-try:
-    from IPython import get_ipython
     from IPython.display import Math
 
-    IN_NOTEBOOK = get_ipython().__class__.__name__ == "ZMQInteractiveShell"
-except ImportError:
-    IN_NOTEBOOK = False
-
 __all__ = ["QuantumState"]
 
+_SQRT_NUM_COMPLEX = ((" (1+i", " (1-i"), ("(-1+i", "(-1-i"))
+_SQRT_NUM_REAL = ("   1", "  -1")
+_SQRT_NUM_IMAG = ("   i", "  -i")
+
+
+def _in_notebook() -> bool:
+    """Check for a Jupyter kernel without importing IPython."""
+    ipython = modules.get("IPython")
+    if ipython is None:
+        return False
+    return ipython.get_ipython().__class__.__name__ == "ZMQInteractiveShell"
+
 
 class QuantumState:
     """Snapshot of a quantum state.
@@ -73,14 +77,26 @@ class QuantumState:
         qubits: Qubits from which to capture a quantum state snapshot.
     """
 
+    __slots__ = (
+        "qubits",
+        "process",
+        "index",
+        "size",
+        "_states",
+        "_probabilities",
+        "_sampler",
+    )
+
     def __init__(self, qubits: Quant):
         self.qubits = qubits
         self.process = qubits.process
+        self.size = len(qubits.qubits)
         self.index = self.process.dump(
-            (c_size_t * len(qubits.qubits))(*qubits.qubits), len(qubits.qubits)
+            (c_size_t * self.size)(*qubits.qubits), self.size
         ).value
-        self.size = len(qubits)
         self._states = None
+        self._probabilities = None
+        self._sampler = None
 
     def _get_ket_process(self):
         return self.process
@@ -89,24 +105,24 @@ class QuantumState:
         if self._states is None:
             available, size = self.process.get_dump_size(self.index)
             if available.value:
+                get_dump = self.process.get_dump
                 states = defaultdict(complex)
                 for i in range(size.value):
-                    state, state_size, amp_real, amp_imag = self.process.get_dump(
-                        self.index, i
+                    state, state_size, amp_real, amp_imag = get_dump(self.index, i)
+                    state = reduce(
+                        lambda acc, word: (acc << 64) | word,
+                        state[: state_size.value],
+                        0,
                     )
-                    state = int(
-                        "".join(f"{state[j]:064b}" for j in range(state_size.value)), 2
-                    )
-                    amplitude = complex(amp_real.value, amp_imag.value)
-                    states[state] += amplitude
+                    states[state] += complex(amp_real.value, amp_imag.value)
 
-                p = sum(map(lambda a: abs(a) ** 2, states.values()))
+                p = sum(abs(amplitude) ** 2 for amplitude in states.values())
                 if abs(p - 1.0) < 1e-10:
                     self._states = dict(states)
                 else:
+                    norm = sqrt(p)
                     self._states = {
-                        state: amplitude / sqrt(p)
-                        for state, amplitude in states.items()
+                        state: amplitude / norm for state, amplitude in states.items()
                     }
 
     @property
@@ -146,7 +162,11 @@ class QuantumState:
         self._check()
         if self._states is None:
             return None
-        return dict(map(lambda a: (a[0], abs(a[1]) ** 2), self._states.items()))
+        if self._probabilities is None:
+            self._probabilities = {
+                state: abs(amp) ** 2 for state, amp in self._states.items()
+            }
+        return self._probabilities
 
     def sample(self, shots=4096, seed=None) -> dict[int, int] | None:
         """Get the quantum execution shots.
@@ -167,18 +187,23 @@ class QuantumState:
         if self._states is None:
             return None
 
-        rng = Random(seed)
-        shots = rng.choices(list(self.states), list(self.probabilities), k=shots)
-        result = {}
-        for state in shots:
-            if state not in result:
-                result[state] = 1
-            else:
-                result[state] += 1
-        return result
+        if self._sampler is None:
+            self._sampler = (
+                list(self._states),
+                list(accumulate(self.probabilities.values())),
+            )
+        population, cum_weights = self._sampler
+
+        return dict(
+            Counter(Random(seed).choices(population, cum_weights=cum_weights, k=shots))
+        )
 
     @staticmethod
     def _sphere():  # pylint: disable=too-many-locals
+        # pylint: disable=import-outside-toplevel,import-error
+        import numpy as np
+        import plotly.graph_objs as go
+
         phi = np.linspace(0, np.pi, 20)
         theta = np.linspace(0, 2 * np.pi, 40)
         phi, theta = np.meshgrid(phi, theta)
@@ -286,6 +311,9 @@ class QuantumState:
         if len(self.qubits) != 1:
             raise ValueError("Bloch sphere plot is available only for 1 qubit")
         _check_visualize()
+        # pylint: disable=import-outside-toplevel,import-error
+        import numpy as np
+        import plotly.graph_objs as go
 
         ket = np.array(
             [
@@ -422,7 +450,7 @@ class QuantumState:
         """
 
         if mode is None:
-            if IN_NOTEBOOK:
+            if _in_notebook():
                 mode = "latex"
             else:
                 mode = "str"
@@ -448,57 +476,73 @@ class QuantumState:
 
     def _show_str(self, fmt=list[tuple[Literal["i", "b"], int, int]]) -> str:
 
-        def fmt_ket(state, begin, end, f):
-            return (
-                f"|{state[begin:end]}⟩"
-                if f == "b"
-                else f"|{int(state[begin:end], base=2)}⟩"
+        size = self.size
+        segments = []
+        for f, begin, end in fmt:
+            begin, end = min(begin, size), min(end, size)
+            if end <= begin:
+                # Segments past the end of the register render as an empty ket.
+                if f != "b":
+                    raise ValueError(
+                        f"Format string exceeds the {size} qubits of the quantum state"
+                    )
+                segments.append((0, 0, ""))
+                continue
+            segments.append(
+                (
+                    size - end,
+                    (1 << (end - begin)) - 1,
+                    f"0{end - begin}b" if f == "b" else "d",
+                )
             )
 
         def state_amp_str(state, amp):
-            dump_str = "".join(
-                fmt_ket(f"{state:0{self.size}b}", b, e, f) for f, b, e in fmt
-            )
-            dump_str += f"\t({100*abs(amp)**2:.2f}%)\n"
-            real = abs(amp.real) > 1e-10
-            real_l0 = amp.real < 0
-
-            imag = abs(amp.imag) > 1e-10
-            imag_l0 = amp.imag < 0
-
-            sqrt_dem = 1 / abs(amp) ** 2
-            use_sqrt = abs(round(sqrt_dem) - sqrt_dem) < 0.001
-            use_sqrt = use_sqrt and (
-                (abs(abs(amp.real) - abs(amp.imag)) < 1e-6) or (real != imag)
+            dump_str = [
+                f"|{format((state >> shift) & mask, spec) if spec else ''}⟩"
+                for shift, mask, spec in segments
+            ]
+            probability = abs(amp) ** 2
+            dump_str.append(f"\t({100*probability:.2f}%)\n")
+            abs_real = abs(amp.real)
+            abs_imag = abs(amp.imag)
+            real = abs_real > 1e-10
+            imag = abs_imag > 1e-10
+
+            inv_probability = 1 / probability
+            use_sqrt = abs(round(inv_probability) - inv_probability) < 0.001 and (
+                abs(abs_real - abs_imag) < 1e-6 or real != imag
             )
-            sqrt_dem = f"/√{round(1/abs(amp)**2)}"
 
             if real and imag:
-                sqrt_dem = f"/√{round(2*(1/abs(amp)**2))}"
-                sqrt_num = ("(-1" if real_l0 else " (1") + ("-i" if imag_l0 else "+i")
+                dump_str.append(f"{amp.real:9.6f}{amp.imag:+.6f}i")
+                sqrt_num = _SQRT_NUM_COMPLEX[amp.real < 0][amp.imag < 0]
                 sqrt_str = (
-                    f"\t≅ {sqrt_num}){sqrt_dem}"
-                    if use_sqrt and (abs(amp.real) - abs(amp.real) < 1e-10)
-                    else ""
+                    f"\t≅ {sqrt_num})/√{round(2*inv_probability)}" if use_sqrt else ""
                 )
-                dump_str += f"{amp.real:9.6f}{amp.imag:+.6f}i" + sqrt_str
             elif real:
-                sqrt_num = "  -1" if real_l0 else "   1"
-                sqrt_str = f"\t≅   {sqrt_num}{sqrt_dem}" if use_sqrt else ""
-                dump_str += f"{amp.real:9.6f}       " + sqrt_str
+                dump_str.append(f"{amp.real:9.6f}       ")
+                sqrt_num = _SQRT_NUM_REAL[amp.real < 0]
+                sqrt_str = (
+                    f"\t≅   {sqrt_num}/√{round(inv_probability)}" if use_sqrt else ""
+                )
             else:
-                sqrt_num = "  -i" if imag_l0 else "   i"
-                sqrt_str = f"\t≅   {sqrt_num}{sqrt_dem}" if use_sqrt else ""
-                dump_str += f" {amp.imag:17.6f}i" + sqrt_str
+                dump_str.append(f" {amp.imag:17.6f}i")
+                sqrt_num = _SQRT_NUM_IMAG[amp.imag < 0]
+                sqrt_str = (
+                    f"\t≅   {sqrt_num}/√{round(inv_probability)}" if use_sqrt else ""
+                )
 
-            return dump_str
+            dump_str.append(sqrt_str)
+            return "".join(dump_str)
 
         return "\n".join(
-            state_amp_str(state, amp)
-            for state, amp in sorted(self.get().items(), key=lambda k: k[0])
+            [state_amp_str(state, amp) for state, amp in sorted(self.get().items())]
         )
 
     def _show_latex(self, fmt=list[tuple[Literal["i", "b"], int, int]]) -> Math:
+        # pylint: disable=import-outside-toplevel,import-error
+        from IPython.display import Math
+
         def float_to_math(num: float, is_complex: bool) -> str | None:
             num_str = None
             if abs(num) > 1e-14:
@@ -558,11 +602,14 @@ class QuantumState:
             Histogram of the quantum state.
         """
         _check_visualize()
+        # pylint: disable=import-outside-toplevel,import-error
+        import plotly.express as px
 
+        states = self.get()
         data = {
-            "State": list(self.get().keys()),
-            "Probability": list(map(lambda a: abs(a) ** 2, self.get().values())),
-            "Phase": list(map(phase, self.get().values())),
+            "State": list(states.keys()),
+            "Probability": list(self.probabilities.values()),
+            "Phase": list(map(phase, states.values())),
         }
 
         fig = px.bar(
@@ -12,7 +12,7 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-from ctypes import CFUNCTYPE, POINTER, c_uint8, c_size_t
+from ctypes import CFUNCTYPE, POINTER, c_uint8, c_size_t, string_at
 from .clib.libket import BatchCExecution, make_configuration
 
 try:
@@ -86,10 +86,10 @@ class Remote:  # pylint: disable=too-few-public-methods,too-many-instance-attrib
             physical_circuit_size,
         ):
             self._logical_circuit = json.loads(
-                bytearray(logical_circuit[:logical_circuit_size])
+                string_at(logical_circuit, logical_circuit_size)
             )
             self._physical_circuit = json.loads(
-                bytearray(physical_circuit[:physical_circuit_size])
+                string_at(physical_circuit, physical_circuit_size)
             )
             self._submit()
 
@@ -0,0 +1,22 @@
+""" Test module for the IBMClient result formatting """
+
+# SPDX-FileCopyrightText: 2024 Evandro Chagas Ribeiro da Rosa <evandro@quantuloop.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+ibm_client = pytest.importorskip("ket.ibm.ibm_client")
+
+
+def test_format_result_merges_samples():
+    """Outcomes that decode to the same sampled state are reported once."""
+
+    client = object.__new__(ibm_client.IBMClient)
+    raw_results = {"samples": {"001": 3, "011": 5, "000": 2}, "exp_values": []}
+
+    result = client.format_result(raw_results, {}, {0: [0]})
+
+    states, counts = result["samples"][0]
+    assert sorted(states) == [0, 1]
+    assert dict(zip(states, counts)) == {1: 8, 0: 2}
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2024 Evandro Chagas Ribeiro da Rosa <evandro@quantuloop.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import ket
+import pytest
+
+
+def test_iter_concat():
+    p = ket.Process()
+    q = p.alloc(5)
+
+    assert [qubit.qubits for qubit in q] == [[i] for i in q.qubits]
+    assert ket.I(list(q)).qubits == q.qubits
+    assert ket.I(list(reversed(q))).qubits == list(reversed(q.qubits))
+    assert q.at([4, 0, 2]).qubits == [q.qubits[4], q.qubits[0], q.qubits[2]]
+
+
+def test_concat_errors():
+    p = ket.Process()
+    a, b = p.alloc(2)
+
+    with pytest.raises(ValueError):
+        ket.I([a, b, a])
+
+    with pytest.raises(ValueError):
+        a + a
+
+    with pytest.raises(ValueError):
+        ket.I([a, ket.Process().alloc()])
@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: 2024 Evandro Chagas Ribeiro da Rosa <evandro@quantuloop.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import ket
+
+
+def test_sample_weights():
+    p = ket.Process()
+    state = ket.dump(ket.H(p.alloc()))
+
+    shots = 4096
+    result = state.sample(shots, seed=42)
+
+    assert set(result) == {0, 1}
+    assert sum(result.values()) == shots
+    assert all(0.4 * shots < count < 0.6 * shots for count in result.values())